@@ -4,7 +4,11 @@ import logging
 import heapq
 import itertools
 import time
-import threading
+
+try:
+    from threading import get_ident
+except ImportError:  # Python 2
+    from thread import get_ident
 
 from . import futures
 from . import events
@@ -12,8 +16,36 @@ from . import messages
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    _monotonic = time.monotonic
+except AttributeError:  # Python 2
+    _monotonic = time.time
+
 __all__ = ['BaseEventLoop']
 
+# Rebuild the timer heap once there are at least this many cancelled timers
+# in it and they make up more than half of the heap
+_MIN_CANCELLED_TIMERS = 50
+
+# Subjects of the messages sent when loop objects are inserted/removed
+_OBJECT_INSERTED = 'loop.object.%s.inserted'
+_OBJECT_REMOVED = 'loop.object.%s.removed'
+
+
+def _indexed_types(cls):
+    """
+    Get the classes in the MRO of `cls` that objects are indexed by.  Only
+    classes with a plain metaclass are indexed as for those isinstance() is
+    the same as being in the MRO.  Filtering by anything else (e.g. an ABC)
+    scans the objects instead.
+
+    :param cls: The class of a loop object
+    :return: The classes to index the object under
+    :rtype: tuple
+    """
+    return tuple(base for base in cls.__mro__
+                 if type(base) is type and base is not object)
+
 
 class AbstractEventLoop(object):
     __metaclass__ = ABCMeta
@@ -39,6 +71,31 @@ class AbstractEventLoop(object):
     def call_soon(self, fn, *args):
         pass
 
+    @abstractmethod
+    def call_soon_batch(self, callbacks):
+        """
+        Schedule a number of callbacks to be called on the next tick, in order.
+
+        :param callbacks: An iterable of (callback, args) pairs where args is
+            a tuple of the callback arguments
+        :return: The callback handles
+        :rtype: list
+        """
+        pass
+
+    @abstractmethod
+    def call_every_tick(self, fn, *args):
+        """
+        Schedule a callback to be called on every tick until the returned
+        handle is cancelled.
+
+        :param fn: The callback function
+        :param args: The function arguments
+        :return: A callback handle
+        :rtype: :class:`events.Handle`
+        """
+        pass
+
     @abstractmethod
     def call_later(self, delay, callback, *args):
         """
@@ -155,43 +212,150 @@ class AbstractEventLoop(object):
 
 
 class _EventLoop(object):
+    __slots__ = ('_engine', '_ready', '_repeating', '_scheduled', '_counter',
+                 '_by_owner', '_tracked', '_timer_cancelled_count', '_closed')
+
     def __init__(self, engine):
         self._engine = engine
         self._ready = deque()
+        # Handles that are run every tick, these stay put rather than being
+        # recreated each time
+        self._repeating = []
+        # Heap of (when, counter, handle) entries, the counter breaks ties
+        # so that handles themselves never get compared
         self._scheduled = []
+        self._counter = itertools.count()
+        # id(owner) -> {id(handle): handle} for the pending callbacks that are
+        # bound methods of watched owners (the loop objects)
+        self._by_owner = {}
+        # id(handle) -> the _by_owner entry it is in, so that forgetting a
+        # callback that was never tracked is a single failed lookup
+        self._tracked = {}
+        self._timer_cancelled_count = 0
         self._closed = False
 
     def _tick(self):
+        # Get rid of cancelled timers, either all at once if there are lots
+        # or just the ones at the head of the heap
+        scheduled = self._scheduled
+        if self._timer_cancelled_count > _MIN_CANCELLED_TIMERS and \
+                self._timer_cancelled_count > len(scheduled) >> 1:
+            live = []
+            for entry in scheduled:
+                if entry[2]._cancelled:
+                    entry[2]._scheduled = False
+                else:
+                    live.append(entry)
+            heapq.heapify(live)
+            self._scheduled = scheduled = live
+            self._timer_cancelled_count = 0
+        else:
+            while scheduled and scheduled[0][2]._cancelled:
+                self._timer_cancelled_count -= 1
+                _, _, handle = heapq.heappop(scheduled)
+                handle._scheduled = False
+
         # Handle scheduled callbacks that are ready
-        end_time = self._engine.time() + self._engine.clock_resolution
-        while self._scheduled:
-            handle = self._scheduled[0]
-            if handle._when >= end_time:
-                break
-            handle = heapq.heappop(self._scheduled)
-            handle._scheduled = False
-            self._ready.append(handle)
-
-        # Call ready callbacks
-        todo = len(self._ready)
-        for _ in range(todo):
-            handle = self._ready.popleft()
-            if handle._cancelled:
-                continue
+        if scheduled:
+            engine = self._engine
+            end_time = engine.time() + engine.clock_resolution
+            heappop = heapq.heappop
+            make_ready = self._ready.append
+            while scheduled and scheduled[0][0] < end_time:
+                handle = heappop(scheduled)[2]
+                handle._scheduled = False
+                if handle._cancelled:
+                    self._timer_cancelled_count -= 1
+                else:
+                    make_ready(handle)
+
+        error = self._run_repeating() if self._repeating else None
+
+        # Call ready callbacks, any that they schedule will run next tick
+        ready, self._ready = self._ready, deque()
+        popleft = ready.popleft
+        tracked = self._tracked
+        try:
+            while ready:
+                handle = popleft()
+                if not handle._cancelled:
+                    # Inlined _forget()
+                    if tracked:
+                        owned = tracked.pop(id(handle), None)
+                        if owned is not None:
+                            del owned[id(handle)]
+                    handle._run()
+        finally:
+            if ready:
+                # A callback raised, put back the ones that didn't get to run
+                ready.extend(self._ready)
+                self._ready = ready
 
-            handle._run()
+        if error is not None:
+            raise error
 
     def call_soon(self, fn, *args):
-        handle = events.Handle(fn, args, self)
+        # Same as _call_soon() but spelled out to save a call on the hot path
+        if args:
+            handle = events.Handle(fn, args, self)
+        else:
+            handle = events._NoArgsHandle(fn, args, self)
+        # Inlined _track()
+        if self._by_owner:
+            owned = self._by_owner.get(id(getattr(fn, '__self__', None)))
+            if owned is not None:
+                owned[id(handle)] = handle
+                self._tracked[id(handle)] = owned
         self._ready.append(handle)
         return handle
 
+    def call_soon_batch(self, callbacks):
+        handles = [events.Handle(fn, args, self) for fn, args in callbacks]
+        for handle in handles:
+            self._track(handle)
+        self._ready.extend(handles)
+        return handles
+
+    def call_every_tick(self, fn, *args):
+        if args:
+            handle = events.Handle(fn, args, self)
+        else:
+            handle = events._NoArgsHandle(fn, args, self)
+        self._track(handle)
+        self._repeating.append(handle)
+        return handle
+
     def call_later(self, delay, fn, *args):
-        return self.call_at(self._engine.time() + delay, fn, *args)
+        return self._call_at(self._engine.time() + delay, fn, args)
 
     def call_at(self, when, fn, *args):
-        timer = events.TimerHandle(when, fn, args, self)
-        heapq.heappush(self._scheduled, timer)
+        return self._call_at(when, fn, args)
+
+    def _call_soon(self, fn, args):
+        """
+        Like :meth:`call_soon` but taking the arguments as a tuple.
+        """
+        if args:
+            handle = events.Handle(fn, args, self)
+        else:
+            handle = events._NoArgsHandle(fn, args, self)
+        # Inlined _track()
+        if self._by_owner:
+            owned = self._by_owner.get(id(getattr(fn, '__self__', None)))
+            if owned is not None:
+                owned[id(handle)] = handle
+                self._tracked[id(handle)] = owned
+        self._ready.append(handle)
+        return handle
+
+    def _call_at(self, when, fn, args):
+        """
+        Like :meth:`call_at` but taking the arguments as a tuple.
+        """
+        timer = events.TimerHandle._make(when, fn, args, self)
+        self._track(timer)
+        heapq.heappush(self._scheduled, (when, next(self._counter), timer))
+        timer._scheduled = True
         return timer
 
     def _close(self):
@@ -200,25 +364,109 @@ class _EventLoop(object):
 
         self._closed = True
         self._ready.clear()
+        del self._repeating[:]
         del self._scheduled[:]
+        self._by_owner.clear()
+        self._tracked.clear()
+        self._timer_cancelled_count = 0
+
+    def _run_repeating(self):
+        """
+        Run the callbacks that are called every tick.  One that raises is
+        cancelled, just as if it hadn't rescheduled itself, and doesn't stop
+        the rest of the tick from running.
+
+        :return: The first exception raised by a callback, or None
+        """
+        error = None
+        cancelled = False
+        # Go through a copy, any added by the callbacks start next tick
+        for handle in self._repeating[:]:
+            if handle._cancelled:
+                cancelled = True
+                continue
+            try:
+                handle._run()
+            except Exception as exc:
+                # Only the first exception gets raised so make sure none are
+                # lost
+                _LOGGER.exception("Repeating callback %r raised, cancelling it",
+                                  handle)
+                handle.cancel()
+                cancelled = True
+                if error is None:
+                    error = exc
+
+        if cancelled:
+            self._repeating = [handle for handle in self._repeating
+                               if not handle._cancelled]
+        return error
+
+    def _timer_handle_cancelled(self, handle):
+        self._timer_cancelled_count += 1
+
+    def _watch(self, owner):
+        """
+        Start tracking the callbacks that are bound methods of `owner`.  Only
+        watched owners are tracked so other callbacks don't pay for it.
+
+        :param owner: The object the callbacks are bound to
+        """
+        self._by_owner.setdefault(id(owner), {})
+
+    def _pop_owned_by(self, owner):
+        """
+        Stop watching `owner` and return its pending callbacks.
+
+        :param owner: The object the callbacks are bound to
+        :return: The callback handles
+        :rtype: list
+        """
+        owned = self._by_owner.pop(id(owner), {})
+        for handle_id in owned:
+            del self._tracked[handle_id]
+        return list(owned.values())
+
+    def _track(self, handle):
+        if self._by_owner:
+            owned = self._by_owner.get(id(getattr(handle._fn, '__self__', None)))
+            if owned is not None:
+                owned[id(handle)] = handle
+                self._tracked[id(handle)] = owned
+
+    def _forget(self, handle):
+        owned = self._tracked.pop(id(handle), None)
+        if owned is not None:
+            del owned[id(handle)]
 
 
 class BaseEventLoop(AbstractEventLoop):
+    clock_resolution = 0.1
+
     def __init__(self):
         self._stopping = False
         self._event_loop = _EventLoop(self)
+        # Schedule straight on the event loop, unless a subclass has
+        # overridden how it's done.  Compare the plain functions as on Python 2
+        # class attribute access gives a new unbound method each time.
+        for name in ('call_soon', 'call_soon_batch', 'call_every_tick',
+                     'call_later'):
+            method = getattr(type(self), name)
+            if getattr(method, '__func__', method) is vars(BaseEventLoop)[name]:
+                setattr(self, name, getattr(self._event_loop, name))
 
         self._objects = {}
+        # class -> {uuid: object} for the objects that are instances of it, see
+        # _indexed_types()
+        self._objects_by_type = {}
+        # class -> the result of _indexed_types() for it
+        self._indexed_types_cache = {}
         self._object_factory = None
 
         self._thread_id = None
 
         self.__mailman = messages.Mailman(self)
 
-    @property
-    def clock_resolution(self):
-        return 0.1
-
     def is_running(self):
         """
         Returns True if the event loop is running.
@@ -232,7 +480,7 @@ class BaseEventLoop(AbstractEventLoop):
         return futures.Future(self)
 
     def run_forever(self):
-        self._thread_id = threading.current_thread().ident
+        self._thread_id = get_ident()
 
         try:
             while not self._stopping:
@@ -248,9 +496,16 @@ class BaseEventLoop(AbstractEventLoop):
         :type awaitable: :class:`futures.Awaitable`
         :return: The result of the awaitable
         """
-        if not awaitable.done():
-            awaitable.add_done_callback(self._run_until_complete_cb)
+        if awaitable.done():
+            return awaitable.result()
+
+        awaitable.add_done_callback(self._run_until_complete_cb)
+        try:
             self.run_forever()
+        finally:
+            # Only left registered if the loop was stopped early
+            if not awaitable.done():
+                awaitable.remove_done_callback(self._run_until_complete_cb)
 
         return awaitable.result()
 
@@ -265,15 +520,24 @@ class BaseEventLoop(AbstractEventLoop):
         """
         return self._event_loop.call_soon(fn, *args)
 
+    def call_soon_batch(self, callbacks):
+        return self._event_loop.call_soon_batch(callbacks)
+
+    def call_every_tick(self, fn, *args):
+        return self._event_loop.call_every_tick(fn, *args)
+
     def call_later(self, delay, fn, *args):
         return self._event_loop.call_later(delay, fn, *args)
 
     def objects(self, obj_type=None):
         # Filter the type if necessary
-        if obj_type is not None:
-            return [obj for obj in self._objects.itervalues() if isinstance(obj, obj_type)]
+        if obj_type is None:
+            return list(self._objects.values())
+        elif type(obj_type) is type and obj_type is not object:
+            return list(self._objects_by_type.get(obj_type, {}).values())
         else:
-            return self._objects.values()
+            # Tuples of types, ABCs, etc. that the index can't answer for
+            return [obj for obj in self._objects.values() if isinstance(obj, obj_type)]
 
     def get_object(self, uuid):
         try:
@@ -290,7 +554,7 @@ class BaseEventLoop(AbstractEventLoop):
         self._stopping = True
 
     def tick(self):
-        self._thread_id = threading.current_thread().ident
+        self._thread_id = get_ident()
         try:
             self._tick()
         finally:
@@ -303,36 +567,26 @@ class BaseEventLoop(AbstractEventLoop):
         self.__event_helper.remove_listener(listener)
 
     def time(self):
-        return time.time()
+        return _monotonic()
 
     def messages(self):
         return self.__mailman
 
     # region Objects
     def create(self, object_type, *args, **kwargs):
-        if self._object_factory is None:
-            loop_object = object_type(self, *args, **kwargs)
-        else:
-            loop_object = self._object_factory(self, object_type, *args, **kwargs)
-        self._objects[loop_object.uuid] = loop_object
-
-        self._event_loop.call_soon(self._insert, loop_object)
+        loop_object = self._create_object(object_type, args, kwargs)
+        self._event_loop._call_soon(self._insert, (loop_object,))
         return loop_object
 
     def create_inserted(self, object_type, *args, **kwargs):
-        if self._object_factory is None:
-            loop_object = object_type(self, *args, **kwargs)
-        else:
-            loop_object = self._object_factory(self, object_type, *args, **kwargs)
-        self._objects[loop_object.uuid] = loop_object
-
+        loop_object = self._create_object(object_type, args, kwargs)
         fut = self.create_future()
-        self._event_loop.call_soon(self._insert, loop_object, fut)
+        self._event_loop._call_soon(self._insert, (loop_object, fut))
         return fut
 
     def remove(self, loop_object):
         fut = self.create_future()
-        self._event_loop.call_soon(self._remove, loop_object, fut)
+        self._event_loop._call_soon(self._remove, (loop_object, fut))
         return fut
 
     def set_object_factory(self, factory):
@@ -350,6 +604,8 @@ class BaseEventLoop(AbstractEventLoop):
         self._event_loop._close()
 
         self._objects = None
+        self._objects_by_type = None
+        self._indexed_types_cache = None
         self._object_factory = None
 
         self._thread_id = None
@@ -363,12 +619,42 @@ class BaseEventLoop(AbstractEventLoop):
     def _run_until_complete_cb(self, fut):
         self.stop()
 
+    def _create_object(self, object_type, args, kwargs):
+        if self._object_factory is None:
+            loop_object = object_type(self, *args, **kwargs)
+        else:
+            loop_object = self._object_factory(self, object_type, *args, **kwargs)
+        self._add_object(loop_object)
+        return loop_object
+
+    def _add_object(self, obj):
+        uuid = obj.uuid
+        self._objects[uuid] = obj
+        self._event_loop._watch(obj)
+        obj_class = type(obj)
+        try:
+            obj_types = self._indexed_types_cache[obj_class]
+        except KeyError:
+            obj_types = self._indexed_types_cache[obj_class] = _indexed_types(obj_class)
+        for obj_type in obj_types:
+            self._objects_by_type.setdefault(obj_type, {})[uuid] = obj
+
+    def _discard_object(self, obj):
+        uuid = obj.uuid
+        del self._objects[uuid]
+        for obj_type in self._indexed_types_cache[type(obj)]:
+            objs = self._objects_by_type[obj_type]
+            del objs[uuid]
+            if not objs:
+                del self._objects_by_type[obj_type]
+
     def _insert(self, obj, fut=None):
         uuid = obj.uuid
         obj.on_loop_inserted(self)
         if fut is not None:
             fut.set_result(obj)
-        self.messages().send("loop.object.{}.inserted".format(uuid))
+        if self.__mailman.has_listeners():
+            self.__mailman.send(_OBJECT_INSERTED % uuid)
 
     def _remove(self, obj, fut):
         uuid = obj.uuid
@@ -380,18 +666,13 @@ class BaseEventLoop(AbstractEventLoop):
             fut.set_exception(e)
         else:
             obj.on_loop_removed()
-            self._objects.pop(uuid)
+            self._discard_object(obj)
             fut.set_result(uuid)
-            self.messages().send("loop.object.{}.removed".format(uuid))
+            if self.__mailman.has_listeners():
+                self.__mailman.send(_OBJECT_REMOVED % uuid)
 
             # Cancel any callbacks to the object
-            for cb in itertools.chain(
-                    self._event_loop._ready,
-                    self._event_loop._scheduled):
-                try:
-                    if cb._fn.__self__ is obj:
-                        cb.cancel()
-                        _LOGGER.info("Cancelled callback to '{}' because the loop "
-                                     "object was removed".format(cb._fn))
-                except AttributeError:
-                    pass
+            for cb in self._event_loop._pop_owned_by(obj):
+                _LOGGER.info("Cancelled callback to '%s' because the loop "
+                             "object was removed", cb._fn)
+                cb.cancel()
@@ -60,6 +60,10 @@ def _format_callback_source(func, args):
 
 
 class Handle(object):
+    __slots__ = ['_loop', '_fn', '_args', '_cancelled', '_repr']
+    # The name to show in the repr, defaults to the class name
+    _repr_name = None
+
     def __init__(self, fn, args, loop):
         self._loop = loop
         self._fn = fn
@@ -68,7 +72,7 @@ class Handle(object):
         self._repr = None
 
     def _repr_info(self):
-        info = [self.__class__.__name__]
+        info = [self._repr_name or self.__class__.__name__]
 
         if self._cancelled:
             info.append('cancelled')
@@ -81,25 +85,40 @@ class Handle(object):
     def __repr__(self):
         if self._repr is not None:
             return self._repr
-        info = self._repr_info()
-        return '<%s>' % ' '.join(info)
+        # The callback and arguments don't change until the handle is
+        # cancelled so the formatted string can be reused
+        self._repr = '<%s>' % ' '.join(self._repr_info())
+        return self._repr
 
     def cancel(self):
         if self._cancelled:
             return False
 
+        self._loop._forget(self)
         self._cancelled = True
         self._fn = None
         self._args = None
+        self._repr = None
 
         return True
 
     def _run(self):
-        assert not self._cancelled, "Cannot run a cancelled callback"
-
         self._fn(*self._args)
 
 
+class _NoArgsHandle(Handle):
+    """
+    Handle for callbacks that don't take any arguments
+    """
+
+    __slots__ = []
+    # An implementation detail, so show up as a plain Handle
+    _repr_name = 'Handle'
+
+    def _run(self):
+        self._fn()
+
+
 class TimerHandle(Handle):
     """
     Handle for callbacks scheduled at a given time
@@ -113,43 +132,36 @@ class TimerHandle(Handle):
         self._when = when
         self._scheduled = False
 
+    @classmethod
+    def _make(cls, when, fn, args, loop):
+        """
+        Create a timer handle setting the fields directly rather than going
+        up the chain of __init__ calls.  For use by the event loop.
+        """
+        handle = object.__new__(cls)
+        handle._loop = loop
+        handle._fn = fn
+        handle._args = args
+        handle._cancelled = False
+        handle._repr = None
+        handle._when = when
+        handle._scheduled = False
+        return handle
+
+    def cancel(self):
+        if not super(TimerHandle, self).cancel():
+            return False
+
+        if self._scheduled:
+            self._loop._timer_handle_cancelled(self)
+        return True
+
     def _repr_info(self):
         info = super(TimerHandle, self)._repr_info()
         pos = 2 if self._cancelled else 1
         info.insert(pos, 'when=%s' % self._when)
         return info
 
-    def __hash__(self):
-        return hash(self._when)
-
-    def __lt__(self, other):
-        return self._when < other._when
-
-    def __le__(self, other):
-        if self._when < other._when:
-            return True
-        return self.__eq__(other)
-
-    def __gt__(self, other):
-        return self._when > other._when
-
-    def __ge__(self, other):
-        if self._when > other._when:
-            return True
-        return self.__eq__(other)
-
-    def __eq__(self, other):
-        if isinstance(other, TimerHandle):
-            return (self._when == other._when and
-                    self._fn == other._fn and
-                    self._args == other._args and
-                    self._cancelled == other._cancelled)
-        return NotImplemented
-
-    def __ne__(self, other):
-        equal = self.__eq__(other)
-        return NotImplemented if equal is NotImplemented else not equal
-
 
 class ExecutorHandle(object):
     def __init__(self, fn, args, executor):
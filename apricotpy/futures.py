@@ -1,4 +1,5 @@
 import abc
+import functools
 import concurrent.futures
 
 __all__ = ['CancelledError',
@@ -16,9 +17,10 @@ class InvalidStateError(Error):
     """The operation is not allowed in this state."""
 
 
-_PENDING = 'PENDING'
-_CANCELLED = 'CANCELLED'
-_FINISHED = 'FINISHED'
+# Future states
+_PENDING = 0
+_CANCELLED = 1
+_FINISHED = 2
 
 
 class Awaitable(object):
@@ -26,6 +28,7 @@ class Awaitable(object):
     An interface that defines an object that is awaitable e.g. a Future
     """
     __metaclass__ = abc.ABCMeta
+    __slots__ = []
 
     @abc.abstractmethod
     def done(self):
@@ -53,11 +56,15 @@ class Awaitable(object):
 
 
 class _FutureBase(object):
+    """
+    The state of a future, without any done callbacks
+    """
+    __slots__ = ['_state', '_result', '_exception']
+
     def __init__(self):
         self._state = _PENDING
         self._result = None
         self._exception = None
-        self._callbacks = []
 
     def cancel(self):
         if self.done():
@@ -67,7 +74,7 @@ class _FutureBase(object):
         return True
 
     def cancelled(self):
-        return self._state is _CANCELLED
+        return self._state == _CANCELLED
 
     def done(self):
         return self._state != _PENDING
@@ -75,7 +82,7 @@ class _FutureBase(object):
     def result(self):
         if self.cancelled():
             raise CancelledError()
-        elif self._state is not _FINISHED:
+        elif self._state != _FINISHED:
             raise InvalidStateError("The future has not completed yet")
         elif self._exception is not None:
             raise self._exception
@@ -99,71 +106,40 @@ class _FutureBase(object):
     def exception(self):
         if self.cancelled():
             raise CancelledError()
-        if self._state is not _FINISHED:
+        if self._state != _FINISHED:
             raise InvalidStateError("Exception not set")
 
         return self._exception
 
 
-class Future(Awaitable):
+class Future(_FutureBase, Awaitable):
+    __slots__ = ['_loop', '_callbacks']
+
     def __init__(self, loop):
+        super(Future, self).__init__()
         self._loop = loop
-        self._state = _PENDING
-        self._result = None
-        self._exception = None
-        self._callbacks = []
+        # None, a single callback or a list of callbacks.  Most futures have
+        # at most one so this saves creating a list for each of them.
+        self._callbacks = None
 
     def __invert__(self):
         return self._loop.run_until_complete(self)
 
     def cancel(self):
-        if self.done():
+        if not super(Future, self).cancel():
             return False
 
-        self._state = _CANCELLED
         self._schedule_callbacks()
         return True
 
-    def cancelled(self):
-        return self._state is _CANCELLED
-
-    def done(self):
-        return self._state != _PENDING
-
-    def result(self):
-        if self.cancelled():
-            raise CancelledError()
-        elif self._state is not _FINISHED:
-            raise InvalidStateError("The future has not completed yet")
-        elif self._exception is not None:
-            raise self._exception
-
-        return self._result
-
     def set_result(self, result):
-        if self.done():
-            raise InvalidStateError("The future is already done")
-
-        self._result = result
-        self._state = _FINISHED
+        super(Future, self).set_result(result)
         self._schedule_callbacks()
 
     def set_exception(self, exception):
-        if self.done():
-            raise InvalidStateError("The future is already done")
-
-        self._exception = exception
-        self._state = _FINISHED
+        super(Future, self).set_exception(exception)
         self._schedule_callbacks()
 
-    def exception(self):
-        if self.cancelled():
-            raise CancelledError()
-        if self._state is not _FINISHED:
-            raise InvalidStateError("Exception not set")
-
-        return self._exception
-
     def add_done_callback(self, fn):
         """
         Add a callback to be run when the future becomes done.
@@ -172,8 +148,12 @@ class Future(Awaitable):
         """
         if self.done():
             self._loop.call_soon(fn, self)
-        else:
+        elif self._callbacks is None:
+            self._callbacks = fn
+        elif type(self._callbacks) is list:
             self._callbacks.append(fn)
+        else:
+            self._callbacks = [self._callbacks, fn]
 
     def remove_done_callback(self, fn):
         """
@@ -182,12 +162,21 @@ class Future(Awaitable):
         :return: The number of callback instances removed
         :rtype: int
         """
-        filtered_callbacks = [f for f in self._callbacks if f != fn]
-        removed_count = len(self._callbacks) - len(filtered_callbacks)
-        if removed_count:
-            self._callbacks[:] = filtered_callbacks
+        callbacks = self._callbacks
+        if callbacks is None:
+            return 0
 
-        return removed_count
+        if type(callbacks) is not list:
+            if callbacks != fn:
+                return 0
+            self._callbacks = None
+            return 1
+
+        if fn not in callbacks:
+            return 0
+
+        self._callbacks = [f for f in callbacks if f != fn]
+        return len(callbacks) - len(self._callbacks)
 
     def _schedule_callbacks(self):
         """
@@ -195,30 +184,42 @@ class Future(Awaitable):
         
         The callbacks are scheduled to be called as soon as possible.
         """
-        callbacks = self._callbacks[:]
-        if not callbacks:
+        callbacks = self._callbacks
+        if callbacks is None:
             return
 
-        self._callbacks[:] = []
-        for callback in callbacks:
-            self._loop.call_soon(callback, self)
+        self._callbacks = None
+        if type(callbacks) is list:
+            self._loop.call_soon_batch([(callback, (self,)) for callback in callbacks])
+        else:
+            self._loop.call_soon(callbacks, self)
 
 
 def get_future(task_or_future):
-    if isinstance(task_or_future, Future):
+    if type(task_or_future) is Future or isinstance(task_or_future, Future):
         return task_or_future
     else:
         return task_or_future.future()
 
 
 class _GatheringFuture(Future):
+    __slots__ = ['_children', '_results', '_n_done']
+
     def __init__(self, children, loop):
         super(_GatheringFuture, self).__init__(loop)
         self._children = children
+        self._results = [None] * len(children)
         self._n_done = 0
 
-        for child in self._children:
-            child.add_done_callback(self._child_done)
+        # Take account of any children that are done already straight away
+        # rather than having the loop call us back for each of them
+        for i, child in enumerate(children):
+            if self.done():
+                break
+            if child.done():
+                self._child_done(i, child)
+            else:
+                child.add_done_callback(functools.partial(self._child_done, i))
 
     def cancel(self):
         if self.done():
@@ -231,24 +232,26 @@ class _GatheringFuture(Future):
 
         return ret
 
-    def _child_done(self, future):
+    def _child_done(self, index, future):
         if self.done():
             return
 
         try:
-            if future.exception() is not None:
-                self.set_exception(future.exception())
-                return
+            exception = future.exception()
         except CancelledError as e:
-            self.set_exception(e)
+            exception = e
+        if exception is not None:
+            # Don't keep the children alive any longer than needed
+            self._children = self._results = None
+            self.set_exception(exception)
             return
 
+        self._results[index] = future.result()
         self._n_done += 1
-        if self._n_done == len(self._children):
-            self._all_done()
-
-    def _all_done(self):
-        self.set_result([child.result() for child in self._children])
+        if self._n_done == len(self._results):
+            results = self._results
+            self._children = self._results = None
+            self.set_result(results)
 
 
 def gather(awaitables, loop):
@@ -260,7 +263,9 @@ def gather(awaitables, loop):
     :return: An awaitable representing all the awaitables
     :rtype: :class:`Awaitable`
     """
-    if isinstance(awaitables, Awaitable):
+    # Check for the common case of a list first as it's cheaper than the
+    # Awaitable (abstract base class) instance check
+    if type(awaitables) is not list and isinstance(awaitables, Awaitable):
         return awaitables
 
     return _GatheringFuture(awaitables, loop)
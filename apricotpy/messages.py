@@ -2,7 +2,42 @@ from collections import namedtuple
 import threading
 import re
 
-_WilcardEntry = namedtuple("_WildcardEntry", ['re', 'listeners'])
+try:
+    from sys import intern
+except ImportError:  # Python 2
+    pass
+
+_WilcardEntry = namedtuple("_WildcardEntry", ['re', 'match', 'listeners'])
+
+_WILDCARD_CACHE_SIZE = 512
+# Number of wildcard subjects from which a combined regex is used to check if
+# any of them could match before trying each one
+_MIN_COMBINED_WILDCARDS = 4
+_wildcard_cache = {}
+
+
+def _compile_wildcard(subject):
+    """
+    Get the compiled regular expression for a wildcard subject.  The same few
+    subjects tend to be listened for over and over so these are cached.
+
+    :param subject: The wildcard subject
+    :type subject: str or unicode
+    :return: The compiled regular expression
+    """
+    try:
+        return _wildcard_cache[subject]
+    except KeyError:
+        pass
+
+    # The whole subject has to match and wildcards match any character,
+    # including newlines
+    regex = re.escape(subject).replace(r'\*', '.*').replace(r'\#', '.+')
+    compiled = re.compile(regex + r'\Z', re.DOTALL)
+    if len(_wildcard_cache) >= _WILDCARD_CACHE_SIZE:
+        _wildcard_cache.clear()
+    _wildcard_cache[subject] = compiled
+    return compiled
 
 
 class Mailman(object):
@@ -25,7 +60,7 @@ class Mailman(object):
         :type event: str or unicode
         :return: True if it does, False otherwise
         """
-        return event.find('*') != -1 or event.find('#') != -1
+        return '*' in event or '#' in event
 
     def __init__(self, loop):
         """
@@ -36,6 +71,11 @@ class Mailman(object):
         self.__loop = loop
         self._specific_listeners = {}
         self._wildcard_listeners = {}
+        # Lazily built match of all the wildcard subjects at once
+        self._wildcard_filter = None
+        # The subjects each listener is listening for, this also keeps the
+        # listener lists above free of duplicates
+        self._by_listener = {}
         self._listeners_lock = threading.Lock()
 
     def add_listener(self, listener, subject='*'):
@@ -49,9 +89,17 @@ class Mailman(object):
         """
         if subject is None:
             raise ValueError("Invalid event '{}'".format(subject))
+        if type(subject) is str:
+            # Subjects are kept around as dictionary keys so share them
+            subject = intern(subject)
 
         with self._listeners_lock:
             self._check_listener(listener)
+            subjects = self._by_listener.setdefault(listener, set())
+            if subject in subjects:
+                return
+
+            subjects.add(subject)
             if self.contains_wildcard(subject):
                 self._add_wildcard_listener(listener, subject)
             else:
@@ -67,28 +115,33 @@ class Mailman(object):
         :type subject: str or unicode
         """
         with self._listeners_lock:
+            subjects = self._by_listener.get(listener)
+            if subjects is None:
+                return
+
             if subject is None:
                 # This means remove ALL messages for this listener
-                for evt in self._specific_listeners.keys():
-                    self._remove_specific_listener(listener, evt)
-                for evt in self._wildcard_listeners.keys():
-                    self._remove_wildcard_listener(listener, evt)
+                to_remove = list(subjects)
+            elif subject in subjects:
+                to_remove = [subject]
             else:
-                if self.contains_wildcard(subject):
-                    try:
-                        self._remove_wildcard_listener(listener, subject)
-                    except KeyError:
-                        pass
+                return
+
+            for subj in to_remove:
+                subjects.discard(subj)
+                if self.contains_wildcard(subj):
+                    self._remove_wildcard_listener(listener, subj)
                 else:
-                    try:
-                        self._remove_specific_listener(listener, subject)
-                    except KeyError:
-                        pass
+                    self._remove_specific_listener(listener, subj)
+            if not subjects:
+                del self._by_listener[listener]
 
     def clear_all_listeners(self):
         with self._listeners_lock:
             self._specific_listeners.clear()
             self._wildcard_listeners.clear()
+            self._wildcard_filter = None
+            self._by_listener.clear()
 
     def num_listening(self):
         """
@@ -107,6 +160,15 @@ class Mailman(object):
                 total += len(entry.listeners)
             return total
 
+    def has_listeners(self):
+        """
+        Is anyone listening for messages at all.
+
+        :return: True if there is at least one listener, False otherwise
+        :rtype: bool
+        """
+        return bool(self._specific_listeners or self._wildcard_listeners)
+
     def send(self, subject, body=None):
         """
         Send a message
@@ -114,21 +176,29 @@ class Mailman(object):
         :param subject: The message subject 
         :param body: The body of the message
         """
-        # These loops need to use copies because, e.g., the recipient may
-        # add or remove listeners during the delivery
+        if not (self._specific_listeners or self._wildcard_listeners):
+            return
+
+        # Gather all the deliveries first and schedule them in one go.  This
+        # also means that the recipient adding or removing listeners during
+        # the delivery doesn't affect this message.
+        loop = self.__loop
+        args = (loop, subject, body)
+        deliveries = []
 
         # Deal with the wildcard listeners
-        for evt, entry in self._wildcard_listeners.items():
-            if self._wildcard_match(evt, subject):
-                for l in list(entry.listeners):
-                    self._deliver_msg(l, subject, body)
+        if self._wildcard_listeners and self._may_match_wildcard(subject):
+            for entry in self._wildcard_listeners.values():
+                if entry.match(subject):
+                    deliveries.extend((l, args) for l in entry.listeners)
 
         # And now with the specific listeners
-        try:
-            for l in self._specific_listeners[subject].copy():
-                self._deliver_msg(l, subject, body)
-        except KeyError:
-            pass
+        listeners = self._specific_listeners.get(subject)
+        if listeners:
+            deliveries.extend((l, args) for l in listeners)
+
+        if deliveries:
+            loop.call_soon_batch(deliveries)
 
     def specific_listeners(self):
         return self._specific_listeners
@@ -136,8 +206,23 @@ class Mailman(object):
     def wildcard_listeners(self):
         return self._wildcard_listeners
 
-    def _deliver_msg(self, listener, event, body):
-        self.__loop.call_soon(listener, self.__loop, event, body)
+    def _may_match_wildcard(self, subject):
+        """
+        Quickly check if the subject could match any of the wildcard subjects.
+        With only a few of them it's cheaper to just try each one in turn.
+
+        :param subject: The message subject
+        :return: False if no wildcard subject matches, True otherwise
+        :rtype: bool
+        """
+        if len(self._wildcard_listeners) < _MIN_COMBINED_WILDCARDS:
+            return True
+
+        if self._wildcard_filter is None:
+            regex = '|'.join('(?:{})'.format(entry.re.pattern)
+                             for entry in self._wildcard_listeners.values())
+            self._wildcard_filter = re.compile(regex, re.DOTALL).match
+        return self._wildcard_filter(subject) is not None
 
     @staticmethod
     def _check_listener(listener):
@@ -148,11 +233,12 @@ class Mailman(object):
 
     def _add_wildcard_listener(self, listener, subject):
         if subject in self._wildcard_listeners:
-            self._wildcard_listeners[subject].listeners.add(listener)
+            self._wildcard_listeners[subject].listeners.append(listener)
         else:
-            # Build the regular expression
-            regex = subject.replace('.', '\.').replace('*', '.*').replace('#', '.+')
-            self._wildcard_listeners[subject] = _WilcardEntry(re.compile(regex), {listener})
+            compiled = _compile_wildcard(subject)
+            self._wildcard_listeners[subject] = \
+                _WilcardEntry(compiled, compiled.match, [listener])
+            self._wildcard_filter = None
 
         self.send('mailman.listener_added.{}'.format(subject))
 
@@ -164,14 +250,15 @@ class Mailman(object):
         :param listener: The listener to remove
         :param subject: The subject to stop listening for
         """
-        self._wildcard_listeners[subject].listeners.discard(listener)
+        self._wildcard_listeners[subject].listeners.remove(listener)
         if len(self._wildcard_listeners[subject].listeners) == 0:
             del self._wildcard_listeners[subject]
+            self._wildcard_filter = None
 
         self.send('mailman.listener_removed.{}'.format(subject))
 
     def _add_specific_listener(self, listener, subject):
-        self._specific_listeners.setdefault(subject, set()).add(listener)
+        self._specific_listeners.setdefault(subject, []).append(listener)
 
         self.send('mailman.listener_added.{}'.format(subject))
 
@@ -183,11 +270,8 @@ class Mailman(object):
         :param listener: The listener to remove
         :param subject: The subject to stop listening for
         """
-        self._specific_listeners[subject].discard(listener)
+        self._specific_listeners[subject].remove(listener)
         if len(self._specific_listeners[subject]) == 0:
             del self._specific_listeners[subject]
 
         self.send('mailman.listener_removed.{}'.format(subject))
-
-    def _wildcard_match(self, event, to_match):
-        return self._wildcard_listeners[event].re.match(to_match) is not None
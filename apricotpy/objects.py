@@ -1,5 +1,5 @@
 import abc
-from uuid import uuid1
+from uuid import uuid4
 
 from . import futures
 
@@ -8,13 +8,18 @@ __all__ = ['LoopObject',
            'TickingLoopObject',
            'AwaitableMixin']
 
+# Created for every awaitable loop object
+_FutureBase = futures._FutureBase
+
 
 class LoopObject(object):
+    __slots__ = ['_uuid', '_loop', '__weakref__']
+
     def __init__(self, loop, uuid=None):
         super(LoopObject, self).__init__()
 
         if uuid is None:
-            self._uuid = uuid1()
+            self._uuid = uuid4()
         else:
             self._uuid = uuid
 
@@ -54,7 +59,7 @@ class LoopObject(object):
         return self._loop is not None
 
     def remove(self):
-        return self.loop().remove(self)
+        return self._loop.remove(self)
 
 
 class TickingMixin(object):
@@ -63,10 +68,13 @@ class TickingMixin(object):
     loop.  The user code should go in the `tick()` function.
     """
     __metaclass__ = abc.ABCMeta
+    # Mixins leave the storage to the concrete classes so they can be
+    # combined without instance layout conflicts
+    __slots__ = []
 
     def on_loop_inserted(self, loop):
         super(TickingMixin, self).on_loop_inserted(loop)
-        self._callback_handle = loop.call_soon(self._tick)
+        self._callback_handle = loop.call_every_tick(self.tick)
 
     @abc.abstractmethod
     def tick(self):
@@ -78,25 +86,21 @@ class TickingMixin(object):
 
     def play(self):
         if self._callback_handle is None:
-            self._callback_handle = self.loop().call_soon(self._tick)
-
-    def _tick(self):
-        self.tick()
-        if self._callback_handle is not None:
-            self._callback_handle = self.loop().call_soon(self._tick)
+            self._callback_handle = self._loop.call_every_tick(self.tick)
 
 
 class TickingLoopObject(TickingMixin, LoopObject):
     """Convenience class that defines a ticking LoopObject"""
-    pass
+    __slots__ = ['_callback_handle']
 
 
 class AwaitableMixin(futures.Awaitable):
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
         assert isinstance(self, LoopObject), "Must be used with a loop object"
         super(AwaitableMixin, self).__init__(*args, **kwargs)
-        self._future = futures._FutureBase()
-        self._callbacks = []
+        self._init_awaitable()
 
     def __invert__(self):
         return self._loop.run_until_complete(self)
@@ -114,24 +118,27 @@ class AwaitableMixin(futures.Awaitable):
 
     def set_result(self, result):
         self._future.set_result(result)
-        if self.in_loop():
+        loop = self._loop
+        if loop is not None:
             self._schedule_callbacks()
-            self.loop().remove(self)
+            loop.remove(self)
 
     def exception(self):
         return self._future.exception()
 
     def set_exception(self, exception):
         self._future.set_exception(exception)
-        if self.in_loop():
+        loop = self._loop
+        if loop is not None:
             self._schedule_callbacks()
-            self.loop().remove(self)
+            loop.remove(self)
 
     def cancel(self):
         self._future.cancel()
-        if self.in_loop():
+        loop = self._loop
+        if loop is not None:
             self._schedule_callbacks()
-            self.loop().remove(self)
+            loop.remove(self)
 
     def cancelled(self):
         return self._future.cancelled()
@@ -142,8 +149,9 @@ class AwaitableMixin(futures.Awaitable):
 
         :param fn: The callback function.
         """
-        if self.in_loop() and self.done():
-            self.loop().call_soon(fn, self)
+        loop = self._loop
+        if loop is not None and self.done():
+            loop.call_soon(fn, self)
         else:
             self._callbacks.append(fn)
 
@@ -154,12 +162,12 @@ class AwaitableMixin(futures.Awaitable):
         :return: The number of callback instances removed
         :rtype: int
         """
-        filtered_callbacks = [f for f in self._callbacks if f != fn]
-        removed_count = len(self._callbacks) - len(filtered_callbacks)
-        if removed_count:
-            self._callbacks[:] = filtered_callbacks
+        callbacks = self._callbacks
+        if fn not in callbacks:
+            return 0
 
-        return removed_count
+        self._callbacks = [f for f in callbacks if f != fn]
+        return len(callbacks) - len(self._callbacks)
 
     def _schedule_callbacks(self):
         """
@@ -167,14 +175,21 @@ class AwaitableMixin(futures.Awaitable):
 
         The callbacks are scheduled to be called as soon as possible.
         """
-        callbacks = self._callbacks[:]
+        callbacks = self._callbacks
         if not callbacks:
             return
 
-        self._callbacks[:] = []
-        for callback in callbacks:
-            self.loop().call_soon(callback, self)
+        self._callbacks = []
+        self._loop.call_soon_batch([(callback, (self,)) for callback in callbacks])
+
+    def _init_awaitable(self):
+        """
+        Set up the state of a pending awaitable.  Also used when the object is
+        created without calling __init__, e.g. when loaded from a saved state.
+        """
+        self._future = _FutureBase()
+        self._callbacks = []
 
     def _check_inserted(self):
-        assert self.loop() is not None, \
+        assert self._loop is not None, \
             "Awaitable has not been inserted into the loop yet"
@@ -49,7 +49,7 @@ class Persistable(object):
         if class_name != my_name:
             _LOGGER.warning(
                 "Loading class from a bundle that was created from a class with a different "
-                "name.  This class is '{}', bundle created by '{}'".format(class_name, my_name))
+                "name.  This class is '%s', bundle created by '%s'", my_name, class_name)
 
         task = cls.__new__(cls)
         task.load_instance_state(loop, saved_state, *args)
@@ -117,7 +117,6 @@ class PersistableAwaitableMixin(Persistable):
         assert isinstance(self, futures.Awaitable), "Has to be used with an Awaitable"
         assert isinstance(self, objects.LoopObject), "Has to be used with a LoopObject"
         super(PersistableAwaitableMixin, self).__init__(*args, **kwargs)
-        self.__saved_state = None
 
     def save_instance_state(self, out_state):
         super(PersistableAwaitableMixin, self).save_instance_state(out_state)
@@ -132,20 +131,14 @@ class PersistableAwaitableMixin(Persistable):
 
     def load_instance_state(self, loop, saved_state, *args):
         super(PersistableAwaitableMixin, self).load_instance_state(loop, saved_state, *args)
-        self._future = futures._FutureBase()
-        self._callbacks = []
+        self._init_awaitable()
 
-        try:
+        if self.RESULT in saved_state:
             self.set_result(saved_state[self.RESULT])
-        except KeyError:
-            try:
-                self.set_exception(saved_state[self.EXCEPTION])
-            except KeyError:
-                try:
-                    if saved_state[self.CANCELLED]:
-                        self.cancel()
-                except KeyError:
-                    pass
+        elif self.EXCEPTION in saved_state:
+            self.set_exception(saved_state[self.EXCEPTION])
+        elif saved_state.get(self.CANCELLED, False):
+            self.cancel()
 
 
 class PersistableAwaitableLoopObject(
@@ -183,7 +176,9 @@ class ContextMixin(object):
 
     def load_instance_state(self, loop, saved_state, *args):
         super(ContextMixin, self).load_instance_state(loop, saved_state, *args)
-        self._context = utils.SimpleNamespace(**saved_state[self.CONTEXT])
+        # Load the saved values in one go rather than going through kwargs
+        self._context = utils.SimpleNamespace()
+        self._context.__dict__.update(saved_state[self.CONTEXT])
 
 
 class PersistableTask(
@@ -230,18 +225,14 @@ class PersistableTask(
     def on_loop_inserted(self, loop):
         # Do this before calling super() so the superclass has the right state
 
-        if self.__saved_state is not None:
+        saved_state = self.__saved_state
+        if saved_state is not None:
+            self._load_next_step(saved_state[self.NEXT_STEP])
 
-            self._load_next_step(self.__saved_state[self.NEXT_STEP])
-
-            try:
-                self._awaiting = load_from(loop, self.__saved_state[self.AWAITING])
-            except KeyError:
-                pass
-            try:
-                self._awaiting_result = self.__saved_state[self.AWAITING_RESULT]
-            except KeyError:
-                pass
+            if self.AWAITING in saved_state:
+                self._awaiting = load_from(loop, saved_state[self.AWAITING])
+            if self.AWAITING_RESULT in saved_state:
+                self._awaiting_result = saved_state[self.AWAITING_RESULT]
 
             self.__saved_state = None
 
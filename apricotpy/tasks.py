@@ -32,6 +32,8 @@ _NO_RESULT = ()
 
 class Task(objects.AwaitableMixin, objects.LoopObject):
     __metaclass__ = ABCMeta
+    __slots__ = ['_future', '_callbacks', '_awaiting', '_next_step',
+                 '_awaiting_result', '_paused', '_callback_handle']
 
     Terminated = namedtuple("Terminated", ['result'])
 
@@ -145,7 +147,7 @@ class Task(objects.AwaitableMixin, objects.LoopObject):
 
     def _schedule_step(self):
         assert self._callback_handle is None, "Step already scheduled"
-        self._callback_handle = self.loop().call_soon(self._step)
+        self._callback_handle = self._loop.call_soon(self._step)
 
     def _set_next_step(self, fn):
         if fn is not None:
@@ -6,6 +6,10 @@ class ClassNotFoundException(Exception):
     pass
 
 
+# Class string -> class for those already loaded by load_class()
+_loaded_classes = {}
+
+
 def fullname(obj):
     """
     Get the fully qualified name of an object.
@@ -23,6 +27,11 @@ def load_class(classstring):
     """
     Load a class from a string
     """
+    try:
+        return _loaded_classes[classstring]
+    except KeyError:
+        pass
+
     class_data = classstring.split(".")
     module_path = ".".join(class_data[:-1])
     class_name = class_data[-1]
@@ -31,10 +40,13 @@ def load_class(classstring):
 
     # Finally, retrieve the class
     try:
-        return getattr(module, class_name)
+        cls = getattr(module, class_name)
     except AttributeError:
         raise ClassNotFoundException("Class {} not found".format(classstring))
 
+    _loaded_classes[classstring] = cls
+    return cls
+
 
 class SimpleNamespace(object):
     """
@@ -50,4 +62,14 @@ class SimpleNamespace(object):
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, SimpleNamespace):
+            return NotImplemented
         return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
@@ -1,3 +1,4 @@
+import abc
 import unittest
 import apricotpy
 
@@ -35,3 +36,109 @@ class TestEventLoop(unittest.TestCase):
         result = ~self.loop.remove(obj)
 
         self.assertEqual(result, uuid)
+
+    def test_call_later_order(self):
+        order = []
+
+        when = self.loop.time()
+        for i in range(4):
+            self.loop._event_loop.call_at(when, order.append, i)
+        self.loop._event_loop.call_at(when - 1., order.append, 'first')
+        self.loop.tick()
+
+        self.assertEqual(order, ['first', 0, 1, 2, 3])
+
+    def test_remove_cancels_callbacks(self):
+        class Counter(apricotpy.LoopObject):
+            def __init__(self, loop):
+                super(Counter, self).__init__(loop)
+                self.count = 0
+
+            def increment(self):
+                self.count += 1
+
+        counter = ~self.loop.create_inserted(Counter)
+        removed = self.loop.remove(counter)
+        self.loop.call_soon(counter.increment)
+        self.loop.call_later(0., counter.increment)
+        ~removed
+        self.loop.tick()
+
+        self.assertEqual(counter.count, 0)
+        self.assertFalse(self.loop._event_loop._by_owner)
+
+    def test_cancelled_timers_dropped(self):
+        handles = [self.loop.call_later(100., lambda: None) for _ in range(200)]
+        for handle in handles[:150]:
+            handle.cancel()
+        self.loop.tick()
+
+        self.assertEqual(len(self.loop._event_loop._scheduled), 50)
+        self.assertEqual(self.loop._event_loop._timer_cancelled_count, 0)
+
+    def test_handle_repr(self):
+        self.assertTrue(repr(self.loop.call_soon(len)).startswith('<Handle '))
+        self.assertTrue(repr(self.loop.call_soon(len, 'a')).startswith('<Handle '))
+        self.assertTrue(
+            repr(self.loop.call_later(1., len)).startswith('<TimerHandle '))
+
+    def test_callback_exception_keeps_ready(self):
+        def fail():
+            raise RuntimeError()
+
+        order = []
+        self.loop.call_soon(fail)
+        self.loop.call_soon(order.append, 1)
+        self.assertRaises(RuntimeError, self.loop.tick)
+        self.loop.tick()
+
+        self.assertEqual(order, [1])
+
+    def test_objects_by_type(self):
+        string = self.loop.create(StringObj, 'apricot')
+        obj = self.loop.create(apricotpy.LoopObject)
+
+        self.assertEqual(self.loop.objects(StringObj), [string])
+        self.assertEqual(len(self.loop.objects(apricotpy.LoopObject)), 2)
+        self.assertEqual(len(self.loop.objects()), 2)
+
+        ~self.loop.remove(string)
+        self.assertEqual(self.loop.objects(StringObj), [])
+        self.assertEqual(self.loop.objects(apricotpy.LoopObject), [obj])
+
+    def test_objects_filters(self):
+        Marker = abc.ABCMeta('Marker', (object,), {})
+        Marker.register(StringObj)
+
+        objs = [self.loop.create(StringObj, 'apricot'),
+                self.loop.create(apricotpy.LoopObject),
+                self.loop.create(StringObj, 'pie')]
+
+        self.assertEqual(set(self.loop.objects(apricotpy.LoopObject)), set(objs))
+        self.assertEqual(set(self.loop.objects(StringObj)), {objs[0], objs[2]})
+        self.assertEqual(set(self.loop.objects((StringObj, apricotpy.LoopObject))), set(objs))
+        self.assertEqual(set(self.loop.objects(Marker)), {objs[0], objs[2]})
+        self.assertEqual(set(self.loop.objects(object)), set(objs))
+
+    def test_object_messages(self):
+        subjects = []
+
+        def listener(loop, subject, body):
+            subjects.append(subject)
+
+        self.loop.messages().add_listener(listener, 'loop.object.*')
+        obj = ~self.loop.create_inserted(StringObj, 'apricot')
+        ~self.loop.remove(obj)
+        self.loop.tick()
+
+        self.assertEqual(subjects, ['loop.object.{}.inserted'.format(obj.uuid),
+                                    'loop.object.{}.removed'.format(obj.uuid)])
+
+    def test_call_soon_batch(self):
+        order = []
+        self.loop.call_soon(order.append, 0)
+        handles = self.loop.call_soon_batch([(order.append, (i,)) for i in range(1, 4)])
+        handles[1].cancel()
+        self.loop.tick()
+
+        self.assertEqual(order, [0, 1, 3])
@@ -21,3 +21,53 @@ class TestFuture(unittest.TestCase):
     def test_no_result(self):
         fut = self.loop.create_future()
         self.assertRaises(apricotpy.InvalidStateError, fut.result)
+
+    def test_run_until_complete_stopped(self):
+        fut = self.loop.create_future()
+        self.loop.call_soon(self.loop.stop)
+        self.assertRaises(apricotpy.InvalidStateError, self.loop.run_until_complete, fut)
+
+        # The loop shouldn't be stopped by the first future finishing
+        fut.set_result(None)
+        other = self.loop.create_future()
+        self.loop.call_soon(self.loop.call_soon, other.set_result, 5)
+        self.assertEqual(self.loop.run_until_complete(other), 5)
+
+    def test_callbacks(self):
+        results = []
+        fut = self.loop.create_future()
+        for _ in range(2):
+            fut.add_done_callback(results.append)
+        fut.add_done_callback(self.fail)
+        self.assertEqual(fut.remove_done_callback(self.fail), 1)
+        self.assertEqual(fut.remove_done_callback(self.fail), 0)
+
+        fut.set_result('done yo')
+        self.loop.tick()
+        self.assertEqual(results, [fut, fut])
+
+    def test_remove_only_callback(self):
+        fut = self.loop.create_future()
+        fut.add_done_callback(self.fail)
+        self.assertEqual(fut.remove_done_callback(self.fail), 1)
+
+        fut.set_result('done yo')
+        self.loop.tick()
+
+    def test_gather_done(self):
+        futs = [self.loop.create_future() for _ in range(3)]
+        for i, fut in enumerate(futs):
+            fut.set_result(i)
+
+        gathered = apricotpy.gather(futs, self.loop)
+        self.assertTrue(gathered.done())
+        self.assertEqual(gathered.result(), [0, 1, 2])
+
+    def test_gather(self):
+        futs = [self.loop.create_future() for _ in range(3)]
+        futs[1].set_result(1)
+
+        gathered = apricotpy.gather(futs, self.loop)
+        self.loop.call_soon(futs[0].set_result, 0)
+        self.loop.call_soon(futs[2].set_result, 2)
+        self.assertEqual(self.loop.run_until_complete(gathered), [0, 1, 2])
@@ -0,0 +1,95 @@
+from . import utils
+
+
+class TestMailman(utils.TestCaseWithLoop):
+    def setUp(self):
+        super(TestMailman, self).setUp()
+        self.received = []
+
+    def _listener(self, loop, subject, body):
+        self.received.append(subject)
+
+    def test_wildcard(self):
+        mailman = self.loop.messages()
+        mailman.add_listener(self._listener, 'a.*.c')
+        for subject in ['a.b.c', 'a.b.c.d', 'a.bc', 'aXb.c']:
+            mailman.send(subject)
+        self.loop.tick()
+
+        self.assertEqual(self.received, ['a.b.c'])
+
+    def test_wildcard_newline(self):
+        mailman = self.loop.messages()
+        mailman.add_listener(self._listener)
+        for subject in ['a*', 'b#', 'c.*', 'd.#']:
+            mailman.add_listener(self._listener, subject)
+        mailman.send('x\ny')
+        mailman.send('d.\n')
+        self.loop.tick()
+
+        self.assertEqual(self.received.count('x\ny'), 1)
+        # Both the catch all and 'd.#', with the combined regex used too
+        self.assertEqual(self.received.count('d.\n'), 2)
+
+    def test_wildcard_one_or_more(self):
+        mailman = self.loop.messages()
+        mailman.add_listener(self._listener, 'a.#')
+        for subject in ['a.', 'a.b', 'a.b.c']:
+            mailman.send(subject)
+        self.loop.tick()
+
+        self.assertEqual(self.received, ['a.b', 'a.b.c'])
+
+    def test_specific(self):
+        mailman = self.loop.messages()
+        mailman.add_listener(self._listener, 'a.b')
+        mailman.send('a.b')
+        mailman.send('a.bc')
+        self.loop.tick()
+
+        self.assertEqual(self.received, ['a.b'])
+
+        mailman.remove_listener(self._listener, 'a.b')
+        mailman.send('a.b')
+        self.loop.tick()
+
+        self.assertEqual(self.received, ['a.b'])
+
+    def test_many_wildcards(self):
+        mailman = self.loop.messages()
+        for subject in ['a.*', 'b.*', 'c.#', 'd.*.e', 'a.b.*']:
+            mailman.add_listener(self._listener, subject)
+        for subject in ['a.b.c', 'd.x.e', 'e.f', 'd.x.f']:
+            mailman.send(subject)
+        self.loop.tick()
+
+        # 'a.b.c' matches two of the wildcards
+        self.assertEqual(self.received, ['a.b.c', 'a.b.c', 'd.x.e'])
+
+        mailman.remove_listener(self._listener, 'd.*.e')
+        mailman.send('d.x.e')
+        self.loop.tick()
+
+        self.assertEqual(self.received, ['a.b.c', 'a.b.c', 'd.x.e'])
+
+    def test_remove_all(self):
+        mailman = self.loop.messages()
+        for subject in ['a.b', 'c.*', 'd']:
+            mailman.add_listener(self._listener, subject)
+        mailman.remove_listener(self._listener)
+        self.assertFalse(mailman.has_listeners())
+
+        mailman.send('a.b')
+        self.loop.tick()
+        self.assertEqual(self.received, [])
+
+    def test_add_twice(self):
+        mailman = self.loop.messages()
+        mailman.add_listener(self._listener, 'a.b')
+        mailman.add_listener(self._listener, 'a.b')
+        mailman.send('a.b')
+        self.loop.tick()
+        self.assertEqual(self.received, ['a.b'])
+
+        mailman.remove_listener(self._listener, 'a.b')
+        self.assertFalse(mailman.has_listeners())
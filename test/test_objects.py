@@ -1,3 +1,5 @@
+import random
+
 import apricotpy
 from . import utils
 
@@ -6,6 +8,15 @@ class AwaitableObject(apricotpy.AwaitableMixin, apricotpy.LoopObject):
     pass
 
 
+class TestLoopObject(utils.TestCaseWithLoop):
+    def test_uuid_unaffected_by_seed(self):
+        uuids = set()
+        for _ in range(2):
+            random.seed(0)
+            uuids.add(apricotpy.LoopObject(self.loop).uuid)
+        self.assertEqual(len(uuids), 2)
+
+
 class TestAwaitableLoopObject(utils.TestCaseWithLoop):
     def test_result(self):
         result = "I'm walkin 'ere!"
@@ -21,3 +32,58 @@ class TestAwaitableLoopObject(utils.TestCaseWithLoop):
         self.loop.call_soon(awaitable.cancel)
         with self.assertRaises(apricotpy.CancelledError):
             self.loop.run_until_complete(awaitable)
+
+
+class TickingObject(apricotpy.TickingLoopObject):
+    def __init__(self, loop):
+        super(TickingObject, self).__init__(loop)
+        self.ticks = 0
+
+    def tick(self):
+        self.ticks += 1
+
+
+class FailingTickingObject(TickingObject):
+    def tick(self):
+        super(FailingTickingObject, self).tick()
+        raise RuntimeError("Tick failed")
+
+
+class TestTickingLoopObject(utils.TestCaseWithLoop):
+    def test_tick(self):
+        ticking = ~self.loop.create_inserted(TickingObject)
+        ticks = ticking.ticks
+        for _ in range(3):
+            self.loop.tick()
+        self.assertEqual(ticking.ticks, ticks + 3)
+
+        ticking.pause()
+        self.loop.tick()
+        self.assertEqual(ticking.ticks, ticks + 3)
+
+        ticking.play()
+        self.loop.tick()
+        self.assertEqual(ticking.ticks, ticks + 4)
+
+    def test_tick_raises(self):
+        ticking = self.loop.create(FailingTickingObject)
+        # Insert it
+        self.loop.tick()
+
+        ran = []
+        self.loop.call_soon(ran.append, 1)
+        self.assertRaises(RuntimeError, self.loop.tick)
+        # The rest of the tick still ran
+        self.assertEqual(ran, [1])
+
+        # And the failed object isn't ticked again
+        for _ in range(3):
+            self.loop.tick()
+        self.assertEqual(ticking.ticks, 1)
+
+    def test_remove(self):
+        ticking = ~self.loop.create_inserted(TickingObject)
+        ~self.loop.remove(ticking)
+        ticks = ticking.ticks
+        self.loop.tick()
+        self.assertEqual(ticking.ticks, ticks)